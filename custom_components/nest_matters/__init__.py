@@ -6,7 +6,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN, PLATFORMS
+from .const import DATA_WRITE_SCHEDULER, DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +32,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+
+        # Drop the shared write scheduler once no config entries remain
+        if hass.data[DOMAIN].keys() == {DATA_WRITE_SCHEDULER}:
+            hass.data[DOMAIN].pop(DATA_WRITE_SCHEDULER)
     
     return unload_ok
 
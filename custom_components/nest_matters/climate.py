@@ -1,29 +1,128 @@
 """Climate platform for Nest Matters integration."""
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from functools import cached_property
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.climate import (
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_FAN_MODE,
+    ATTR_FAN_MODES,
+    ATTR_HVAC_MODE,
+    ATTR_HVAC_MODES,
+    ATTR_MAX_TEMP,
+    ATTR_MIN_TEMP,
+    ATTR_PRESET_MODE,
+    ATTR_PRESET_MODES,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, State
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ATTR_TEMPERATURE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfTemperature,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
 
 from .const import (
     CONF_GOOGLE_ENTITY,
     CONF_MATTER_ENTITY,
     CONF_NAME,
+    DATA_WRITE_SCHEDULER,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Coalesce bursts of source updates, across all thermostats, into one flush
+_WRITE_COOLDOWN = 0.05
+
+# Source attributes surfaced by the unified entity; other changes are ignored
+_MATTER_EXPOSED_ATTRS = (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TEMPERATURE,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_TARGET_TEMP_LOW,
+    ATTR_MIN_TEMP,
+    ATTR_MAX_TEMP,
+)
+_GOOGLE_EXPOSED_ATTRS = (
+    ATTR_HVAC_MODES,
+    ATTR_FAN_MODE,
+    ATTR_FAN_MODES,
+    ATTR_PRESET_MODE,
+    ATTR_PRESET_MODES,
+    ATTR_CURRENT_HUMIDITY,
+)
+
+# Source states that carry no usable data
+_BAD_STATES: Final = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
+_EMPTY_ATTRS: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Fallback limits when the Matter entity does not report its own
+_DEFAULT_MIN_TEMP: Final = 7.0
+_DEFAULT_MAX_TEMP: Final = 35.0
+
+# Derived properties memoized until the source they read from changes
+_MATTER_CACHED_PROPERTIES = frozenset(
+    {
+        "current_temperature",
+        "target_temperature",
+        "target_temperature_high",
+        "target_temperature_low",
+        "available",
+    }
+)
+_GOOGLE_CACHED_PROPERTIES = frozenset(
+    {
+        "hvac_mode",
+        "fan_mode",
+        "preset_mode",
+        "current_humidity",
+    }
+)
+
+
+def _exposed_state_changed(
+    old_state: State | None,
+    new_state: State | None,
+    attr_names: tuple[str, ...],
+) -> bool:
+    """Return True if the state or any exposed attribute differs."""
+    if old_state is None or new_state is None:
+        return old_state is not new_state
+    if old_state.state != new_state.state:
+        return True
+    old_attrs = old_state.attributes
+    new_attrs = new_state.attributes
+    if old_attrs is new_attrs:
+        return False
+    return any(old_attrs.get(name) != new_attrs.get(name) for name in attr_names)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -31,6 +130,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Nest Matters climate platform."""
     config = hass.data[DOMAIN][config_entry.entry_id]
+
+    # One scheduler coalesces state writes for every configured thermostat
+    scheduler = hass.data[DOMAIN].get(DATA_WRITE_SCHEDULER)
+    if scheduler is None:
+        scheduler = NestMattersWriteScheduler(hass)
+        hass.data[DOMAIN][DATA_WRITE_SCHEDULER] = scheduler
     
     climate_entity = NestMattersClimate(
         hass,
@@ -38,13 +143,69 @@ async def async_setup_entry(
         config[CONF_MATTER_ENTITY],
         config[CONF_GOOGLE_ENTITY],
         config_entry.entry_id,
+        scheduler,
     )
     
     async_add_entities([climate_entity])
 
+class NestMattersWriteScheduler:
+    """Flush pending state writes for all unified entities on one timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the write scheduler."""
+        self._hass = hass
+        self._entities: list[NestMattersClimate] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, entity: NestMattersClimate) -> None:
+        """Include an entity in future flushes."""
+        self._entities.append(entity)
+
+    @callback
+    def async_unregister(self, entity: NestMattersClimate) -> None:
+        """Stop flushing an entity, cancelling the timer if none remain."""
+        if entity in self._entities:
+            self._entities.remove(entity)
+        if not self._entities and self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Schedule a flush unless one is already pending."""
+        if self._unsub_timer is None:
+            self._unsub_timer = async_call_later(
+                self._hass, _WRITE_COOLDOWN, self._async_flush
+            )
+
+    @callback
+    def _async_flush(self, _now: datetime) -> None:
+        """Write state for every entity with a pending change."""
+        self._unsub_timer = None
+        for entity in self._entities:
+            try:
+                entity.async_write_if_pending()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error updating state of %s", entity.entity_id)
+
 class NestMattersClimate(ClimateEntity):
     """Unified climate entity combining Matter and Google Nest."""
 
+    # No __slots__: Entity does not define them, so instances keep a __dict__
+    # regardless, and the cached_property values below are stored in it.
+
+    # State is pushed from the source entity listener
+    _attr_should_poll = False
+
+    # Declare support for basic temp, ranges (Auto mode), fan, and presets
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+        | ClimateEntityFeature.FAN_MODE
+        | ClimateEntityFeature.PRESET_MODE
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -52,6 +213,7 @@ class NestMattersClimate(ClimateEntity):
         matter_entity_id: str,
         google_entity_id: str,
         entry_id: str,
+        write_scheduler: NestMattersWriteScheduler,
     ) -> None:
         """Initialize the unified climate entity."""
         self.hass = hass
@@ -59,46 +221,109 @@ class NestMattersClimate(ClimateEntity):
         self._matter_entity_id = matter_entity_id
         self._google_entity_id = google_entity_id
         self._entry_id = entry_id
+
+        # Last known state of each source entity, kept current by the listener
+        self._matter_state: State | None = None
+        self._google_state: State | None = None
+
+        # Limits rarely change, so keep them until the Matter attributes do
+        self._min_temp = _DEFAULT_MIN_TEMP
+        self._max_temp = _DEFAULT_MAX_TEMP
+        self._limits_source_attrs: Mapping[str, Any] | None = None
+
+        # Modes the Google entity advertises, rebuilt when its state changes
+        self._hvac_modes: list[HVACMode] = []
+        self._valid_hvac_modes: frozenset[str] = frozenset()
+        self._fan_modes: list[str] = []
+        self._preset_modes: list[str] = []
         
         # Set unique ID
         self._attr_unique_id = f"{DOMAIN}_{entry_id}"
-        
-        # Declare support for basic temp, ranges (Auto mode), fan, and presets
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            | ClimateEntityFeature.FAN_MODE
-            | ClimateEntityFeature.PRESET_MODE
+
+        # Service data targeting each source, extended per call
+        self._matter_entity_payload: Final = MappingProxyType(
+            {ATTR_ENTITY_ID: matter_entity_id}
+        )
+        self._google_entity_payload: Final = MappingProxyType(
+            {ATTR_ENTITY_ID: google_entity_id}
         )
         
         # Track state changes of source entities
-        self._remove_listeners = []
+        self._unsub_source_listener: CALLBACK_TYPE | None = None
+        self._source_dispatch: dict[str, Callable[[State | None], bool]] = {
+            matter_entity_id: self._set_matter_state,
+            google_entity_id: self._set_google_state,
+        }
+        self._write_scheduler = write_scheduler
+        self._write_pending = False
 
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
+        # Prime the source states once; the listener keeps them current
+        self._matter_state = self.hass.states.get(self._matter_entity_id)
+        self._google_state = self.hass.states.get(self._google_entity_id)
+        self._refresh_temp_limits()
+        self._refresh_google_modes()
+        self._invalidate_cache(_MATTER_CACHED_PROPERTIES | _GOOGLE_CACHED_PROPERTIES)
+
         # Listen for changes in source entities
-        self._remove_listeners.append(
-            async_track_state_change_event(
-                self.hass, 
-                [self._matter_entity_id, self._google_entity_id],
-                self._handle_source_state_change
-            )
+        self._unsub_source_listener = async_track_state_change_event(
+            self.hass,
+            [self._matter_entity_id, self._google_entity_id],
+            self._handle_source_state_change,
         )
-        
-        # Initial state update
-        await self.async_update()
+        self._write_scheduler.async_register(self)
+        # The platform writes the initial state once this returns
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity removal."""
-        for remove_listener in self._remove_listeners:
-            remove_listener()
-
-    def _handle_source_state_change(self, event) -> None:
+        if self._unsub_source_listener is not None:
+            self._unsub_source_listener()
+            self._unsub_source_listener = None
+        self._write_scheduler.async_unregister(self)
+        self._write_pending = False
+
+    @callback
+    def _handle_source_state_change(self, event: Event[EventStateChangedData]) -> None:
         """Handle state changes from source entities."""
-        try:
+        if self._source_dispatch[event.data["entity_id"]](event.data["new_state"]):
+            self._write_pending = True
+            self._write_scheduler.async_schedule()
+
+    @callback
+    def async_write_if_pending(self) -> None:
+        """Write state if a source change is waiting to be published."""
+        if self._write_pending:
+            self._write_pending = False
             self.async_write_ha_state()
-        except Exception as err:
-            _LOGGER.debug("Error updating state: %s", err)
+
+    def _set_matter_state(self, new_state: State | None) -> bool:
+        """Store a new Matter state, returning True if exposed data changed."""
+        old_state = self._matter_state
+        self._matter_state = new_state
+        self._refresh_temp_limits()
+
+        # Skip the write when nothing this entity reports has changed
+        if not _exposed_state_changed(old_state, new_state, _MATTER_EXPOSED_ATTRS):
+            return False
+        self._invalidate_cache(_MATTER_CACHED_PROPERTIES)
+        return True
+
+    def _set_google_state(self, new_state: State | None) -> bool:
+        """Store a new Google state, returning True if exposed data changed."""
+        old_state = self._google_state
+        self._google_state = new_state
+
+        if not _exposed_state_changed(old_state, new_state, _GOOGLE_EXPOSED_ATTRS):
+            return False
+        self._refresh_google_modes()
+        self._invalidate_cache(_GOOGLE_CACHED_PROPERTIES)
+        return True
+
+    def _invalidate_cache(self, names: frozenset[str]) -> None:
+        """Drop memoized property values so they are recomputed on next read."""
+        for name in names:
+            self.__dict__.pop(name, None)
 
     @property
     def temperature_unit(self) -> str:
@@ -107,248 +332,207 @@ class NestMattersClimate(ClimateEntity):
         # We must match that to avoid double-conversion
         return self.hass.config.units.temperature_unit
 
+    def _matter_attrs(self) -> Mapping[str, Any]:
+        """Return the Matter entity attributes, or an empty mapping."""
+        matter_state = self._matter_state
+        return matter_state.attributes if matter_state else _EMPTY_ATTRS
+
+    def _google_attrs(self) -> Mapping[str, Any]:
+        """Return the Google entity attributes, or an empty mapping."""
+        google_state = self._google_state
+        return google_state.attributes if google_state else _EMPTY_ATTRS
+
     def _get_matter_temp_attr(self, attr_name: str) -> float | None:
         """Get a temperature attribute from the Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get(attr_name)
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    return None
+        temp = self._matter_attrs().get(attr_name)
+        if temp is not None:
+            try:
+                return float(temp)
+            except (ValueError, TypeError):
+                return None
         return None
 
-    @property
+    @cached_property
     def current_temperature(self) -> float | None:
         """Return current temperature from Matter entity (more responsive)."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("current_temperature")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    return None
-        return None
+        return self._get_matter_temp_attr(ATTR_CURRENT_TEMPERATURE)
 
-    @property
+    @cached_property
     def target_temperature(self) -> float | None:
         """Return target temperature from Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("temperature")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    return None
-        return None
+        return self._get_matter_temp_attr(ATTR_TEMPERATURE)
 
-    @property
+    @cached_property
     def target_temperature_high(self) -> float | None:
         """Return high target temperature from Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("target_temp_high")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    return None
-        return None
+        return self._get_matter_temp_attr(ATTR_TARGET_TEMP_HIGH)
 
-    @property
+    @cached_property
     def target_temperature_low(self) -> float | None:
         """Return low target temperature from Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("target_temp_low")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    return None
-        return None
+        return self._get_matter_temp_attr(ATTR_TARGET_TEMP_LOW)
 
-    @property
+    @cached_property
     def hvac_mode(self) -> HVACMode | None:
         """Return HVAC mode from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.state not in (None, "unknown", "unavailable"):
-            try:
-                return HVACMode(google_state.state)
-            except ValueError:
-                _LOGGER.debug("Unknown HVAC mode: %s", google_state.state)
-                return None
+        google_state = self._google_state
+        if google_state is None:
+            return None
+        state = google_state.state
+        if state in self._valid_hvac_modes:
+            return HVACMode(state)
+        if state not in _BAD_STATES:
+            _LOGGER.debug("Unknown HVAC mode: %s", state)
         return None
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
         """Return available HVAC modes from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            modes = google_state.attributes.get("hvac_modes", [])
-            result = []
-            for mode in modes:
-                try:
-                    result.append(HVACMode(mode))
-                except ValueError:
-                    _LOGGER.debug("Skipping unknown HVAC mode: %s", mode)
-            return result
-        return []
+        return self._hvac_modes
 
-    @property
+    @cached_property
     def fan_mode(self) -> str | None:
         """Return fan mode from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            return google_state.attributes.get("fan_mode")
-        return None
+        return self._google_attrs().get(ATTR_FAN_MODE)
 
     @property
     def fan_modes(self) -> list[str]:
         """Return available fan modes from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            return google_state.attributes.get("fan_modes", [])
-        return []
+        return self._fan_modes
 
-    @property
+    @cached_property
     def preset_mode(self) -> str | None:
         """Return current preset mode from Google entity (home/away/eco)."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            return google_state.attributes.get("preset_mode")
-        return None
+        return self._google_attrs().get(ATTR_PRESET_MODE)
 
     @property
     def preset_modes(self) -> list[str]:
         """Return available preset modes from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            return google_state.attributes.get("preset_modes", [])
-        return []
+        return self._preset_modes
 
-    @property
+    @cached_property
     def current_humidity(self) -> int | None:
         """Return current humidity from Google entity."""
-        google_state = self.hass.states.get(self._google_entity_id)
-        if google_state and google_state.attributes:
-            return google_state.attributes.get("current_humidity")
-        return None
+        return self._google_attrs().get(ATTR_CURRENT_HUMIDITY)
+
+    def _refresh_google_modes(self) -> None:
+        """Rebuild the mode lists advertised by the Google entity."""
+        attrs = self._google_attrs()
+
+        hvac_modes = []
+        for mode in attrs.get(ATTR_HVAC_MODES) or ():
+            try:
+                hvac_modes.append(HVACMode(mode))
+            except ValueError:
+                _LOGGER.debug("Skipping unknown HVAC mode: %s", mode)
+        self._hvac_modes = hvac_modes
+        self._valid_hvac_modes = frozenset(hvac_modes)
+
+        self._fan_modes = list(attrs.get(ATTR_FAN_MODES) or ())
+        self._preset_modes = list(attrs.get(ATTR_PRESET_MODES) or ())
+
+    def _refresh_temp_limits(self) -> None:
+        """Re-read min/max temperature if the Matter attributes changed."""
+        attrs = self._matter_attrs()
+        # HA reuses the attributes object when only the state value changes
+        if attrs is self._limits_source_attrs:
+            return
+        self._limits_source_attrs = attrs
+
+        min_temp = self._get_matter_temp_attr(ATTR_MIN_TEMP)
+        self._min_temp = _DEFAULT_MIN_TEMP if min_temp is None else min_temp
+        max_temp = self._get_matter_temp_attr(ATTR_MAX_TEMP)
+        self._max_temp = _DEFAULT_MAX_TEMP if max_temp is None else max_temp
 
     @property
     def min_temp(self) -> float:
         """Return minimum temperature from Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("min_temp")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    pass
-        return 7.0
+        return self._min_temp
 
     @property
     def max_temp(self) -> float:
         """Return maximum temperature from Matter entity."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        if matter_state and matter_state.attributes:
-            temp = matter_state.attributes.get("max_temp")
-            if temp is not None:
-                try:
-                    return float(temp)
-                except (ValueError, TypeError):
-                    pass
-        return 35.0
+        return self._max_temp
 
-    @property
+    @cached_property
     def available(self) -> bool:
         """Available if Matter is online. Cloud is optional."""
-        matter_state = self.hass.states.get(self._matter_entity_id)
+        matter_state = self._matter_state
         
         # We only strictly require Matter for basic control. 
         # If Google is down, we just lose Humidity/Fan features temporarily.
-        return matter_state is not None and matter_state.state != "unavailable"
+        return matter_state is not None and matter_state.state not in _BAD_STATES
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set temperature via Matter entity (supporting Ranges)."""
-        data = {"entity_id": self._matter_entity_id}
+        data = {**self._matter_entity_payload}
         
         # Handle simple target temperature (Heat or Cool mode)
         if ATTR_TEMPERATURE in kwargs:
-            data["temperature"] = kwargs[ATTR_TEMPERATURE]
+            data[ATTR_TEMPERATURE] = kwargs[ATTR_TEMPERATURE]
             
         # Handle temperature ranges (Heat/Cool Auto mode)
-        if "target_temp_low" in kwargs and "target_temp_high" in kwargs:
-            data["target_temp_low"] = kwargs["target_temp_low"]
-            data["target_temp_high"] = kwargs["target_temp_high"]
+        if ATTR_TARGET_TEMP_LOW in kwargs and ATTR_TARGET_TEMP_HIGH in kwargs:
+            data[ATTR_TARGET_TEMP_LOW] = kwargs[ATTR_TARGET_TEMP_LOW]
+            data[ATTR_TARGET_TEMP_HIGH] = kwargs[ATTR_TARGET_TEMP_HIGH]
             
-        if "temperature" not in data and "target_temp_low" not in data:
+        if ATTR_TEMPERATURE not in data and ATTR_TARGET_TEMP_LOW not in data:
             return
 
-        _LOGGER.debug("Setting temperature via Matter entity: %s", data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Setting temperature via Matter entity: %s", data)
 
         await self.hass.services.async_call(
             "climate",
             "set_temperature",
             data,
+            blocking=False,
         )
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set HVAC mode via Google entity (full features)."""
-        _LOGGER.debug(
-            "Setting HVAC mode to %s via Google entity %s", 
-            hvac_mode, 
-            self._google_entity_id
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Setting HVAC mode to %s via Google entity %s", 
+                hvac_mode, 
+                self._google_entity_id
+            )
 
         await self.hass.services.async_call(
             "climate",
             "set_hvac_mode",
-            {
-                "entity_id": self._google_entity_id,
-                "hvac_mode": hvac_mode,
-            },
+            {**self._google_entity_payload, ATTR_HVAC_MODE: hvac_mode},
+            blocking=False,
         )
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set fan mode via Google entity."""
-        _LOGGER.debug(
-            "Setting fan mode to %s via Google entity %s", 
-            fan_mode, 
-            self._google_entity_id
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Setting fan mode to %s via Google entity %s", 
+                fan_mode, 
+                self._google_entity_id
+            )
 
         await self.hass.services.async_call(
             "climate",
             "set_fan_mode",
-            {
-                "entity_id": self._google_entity_id,
-                "fan_mode": fan_mode,
-            },
+            {**self._google_entity_payload, ATTR_FAN_MODE: fan_mode},
+            blocking=False,
         )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode (home/away/eco) via Google entity."""
-        _LOGGER.debug(
-            "Setting preset mode to %s via Google entity %s", 
-            preset_mode, 
-            self._google_entity_id
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Setting preset mode to %s via Google entity %s", 
+                preset_mode, 
+                self._google_entity_id
+            )
 
         await self.hass.services.async_call(
             "climate",
             "set_preset_mode",
-            {
-                "entity_id": self._google_entity_id,
-                "preset_mode": preset_mode,
-            },
+            {**self._google_entity_payload, ATTR_PRESET_MODE: preset_mode},
+            blocking=False,
         )
-
-    async def async_update(self) -> None:
-        """Update the entity state."""
-        # Force update of state - the properties will pull from source entities
-        pass
@@ -9,6 +9,9 @@ CONF_MATTER_ENTITY = "matter_entity"
 CONF_GOOGLE_ENTITY = "google_entity"
 CONF_NAME = "name"
 
+# hass.data[DOMAIN] key for the shared state write scheduler
+DATA_WRITE_SCHEDULER = "_scheduler"
+
 # Default routing preferences
 DEFAULT_TEMP_SOURCE = "matter"  # Use Matter for temperature control (avoid rate limits)
 DEFAULT_MODE_SOURCE = "google"  # Use Google for HVAC modes (full features)